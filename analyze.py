@@ -4,8 +4,8 @@ Main analysis script for MSTR debt risk assessment.
 Runs all parsers and calculates key risk metrics.
 """
 
-from src.parsers.debt_parser import parse_debt_data, calculate_debt_metrics
-from src.models.liquidation_calculator import LiquidationCalculator
+from src.parsers.debt_parser import load_debt_cached, calculate_debt_metrics
+from src.models.liquidation_calculator import LiquidationCalculator, STRESS_TEST_FORMATS
 import pandas as pd
 
 
@@ -17,7 +17,7 @@ def main():
 
     # Parse debt data
     print("Loading debt data...")
-    debt_df = parse_debt_data('data/raw/DEBT/data.html')
+    debt_df = load_debt_cached('data/raw/DEBT/data.html')
     debt_metrics = calculate_debt_metrics(debt_df)
 
     print(f"\nTotal Debt: ${debt_metrics['total_notional']:,.0f}M")
@@ -29,7 +29,7 @@ def main():
     btc_holdings = 447_470  # Update from latest MSTR filings
     btc_price = 100_000  # Update to current BTC price
     total_debt = debt_metrics['total_notional']
-    annual_interest = total_debt * (debt_metrics['weighted_avg_coupon'] / 100)
+    annual_interest = debt_metrics['annual_interest']
 
     print(f"\n{'=' * 60}")
     print("LIQUIDATION RISK ANALYSIS")
@@ -62,7 +62,8 @@ def main():
     print(f"\n\n{'Stress Test Scenarios':^60}")
     print("=" * 60)
     stress_df = calc.stress_test_scenarios()
-    print(stress_df.to_string(index=False))
+    formatters = {col: fmt.format for col, fmt in STRESS_TEST_FORMATS.items()}
+    print(stress_df.to_string(index=False, formatters=formatters))
 
     print("\n\n" + "=" * 60)
     print("KEY FINDINGS")
@@ -2,12 +2,13 @@
 Configuration settings for MSTR debt analyzer.
 """
 
+import numpy as np
+
 # Default risk thresholds
 RISK_THRESHOLDS = {
     'safe_ltv': 0.50,        # LTV below 50% is considered safe
     'caution_ltv': 0.65,     # LTV 50-65% requires caution
-    'warning_ltv': 0.85,     # LTV 65-85% is concerning
-    'danger_ltv': 0.85,      # LTV above 85% is dangerous
+    'warning_ltv': 0.85,     # LTV 65-85% is concerning, 85%+ is dangerous
 }
 
 # Default BTC parameters
@@ -25,6 +26,10 @@ STRESS_TEST_SCENARIOS = [
     ('-70%', 0.3),
 ]
 
+# Broadcast-ready views of the scenarios above
+STRESS_LABELS = np.array([name for name, _ in STRESS_TEST_SCENARIOS])
+STRESS_MULTIPLIERS = np.array([multiplier for _, multiplier in STRESS_TEST_SCENARIOS])
+
 # Dashboard settings
 DASHBOARD_CONFIG = {
     'page_title': 'MSTR Debt Risk Analyzer',
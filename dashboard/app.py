@@ -4,7 +4,7 @@ Interactive visualization of liquidation scenarios and stress tests.
 """
 
 import streamlit as st
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from pathlib import Path
@@ -13,8 +13,8 @@ import sys
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
-from src.parsers.debt_parser import parse_debt_data, calculate_debt_metrics
-from src.models.liquidation_calculator import LiquidationCalculator
+from src.parsers.debt_parser import load_debt_cached, calculate_debt_metrics
+from src.models.liquidation_calculator import LiquidationCalculator, STRESS_TEST_FORMATS
 
 
 st.set_page_config(
@@ -45,10 +45,57 @@ st.markdown("""
 
 @st.cache_data
 def load_debt_data():
-    """Load and cache debt data."""
-    df = parse_debt_data('data/raw/DEBT/data.html')
+    """Load and cache debt data, plus a copy with dates formatted for display."""
+    df = load_debt_cached('data/raw/DEBT/data.html')
     metrics = calculate_debt_metrics(df)
-    return df, metrics
+
+    display_df = df.assign(**{
+        'Issue Date': df['Issue Date'].dt.strftime('%Y-%m-%d'),
+        'Maturity': df['Maturity'].dt.strftime('%Y-%m-%d'),
+    })
+
+    return df, metrics, display_df
+
+
+def build_calculator(btc_holdings, btc_price, total_notional, annual_interest):
+    """Build a calculator from scenario inputs (debt and interest in millions)."""
+    return LiquidationCalculator(
+        btc_holdings=btc_holdings,
+        btc_price=btc_price,
+        total_debt=total_notional,
+        annual_interest=annual_interest
+    )
+
+
+@st.cache_data
+def compute_scenario(btc_holdings, btc_price, total_notional, annual_interest, ltv_threshold):
+    """Compute and cache headline metrics for a scenario."""
+    calc = build_calculator(btc_holdings, btc_price, total_notional, annual_interest)
+    btc_value = calc.calculate_btc_value()
+    ltv = calc.total_debt / btc_value
+    return {
+        'btc_value': btc_value,
+        'ltv': ltv,
+        'coverage': 1.0 / ltv,
+        'safety': calc.calculate_margin_of_safety(target_ltv=ltv_threshold),
+    }
+
+
+@st.cache_data
+def stress_test_scenarios(btc_holdings, btc_price, total_notional, annual_interest):
+    """Compute and cache the stress test table for a scenario."""
+    calc = build_calculator(btc_holdings, btc_price, total_notional, annual_interest)
+    return calc.stress_test_scenarios()
+
+
+@st.cache_data
+def _price_ltv_curve(btc_holdings, total_notional):
+    """Compute and cache the BTC price vs LTV curve (LTV in %)."""
+    # The curve only depends on holdings and debt, so it is keyed on those alone
+    # and survives changes to the current price input
+    calc = build_calculator(btc_holdings, 0, total_notional, 0)
+    price_range = np.arange(20000, 150000, 5000)
+    return price_range, calc.ltv_ratio(price_range) * 100
 
 
 def main():
@@ -58,7 +105,7 @@ def main():
     st.markdown("---")
 
     # Load data
-    debt_df, debt_metrics = load_debt_data()
+    debt_df, debt_metrics, display_df = load_debt_data()
 
     # Sidebar inputs
     st.sidebar.header("⚙️ Scenario Parameters")
@@ -97,13 +144,18 @@ def main():
         "liquidation risk based on Bitcoin price movements."
     )
 
-    # Initialize calculator
-    calc = LiquidationCalculator(
-        btc_holdings=btc_holdings,
-        btc_price=btc_price,
-        total_debt=debt_metrics['total_notional'],
-        annual_interest=debt_metrics['total_notional'] * (debt_metrics['weighted_avg_coupon'] / 100)
+    # Compute scenario metrics (cached on the scenario inputs)
+    scenario_inputs = (
+        btc_holdings,
+        btc_price,
+        debt_metrics['total_notional'],
+        debt_metrics['annual_interest'],
     )
+    scenario = compute_scenario(*scenario_inputs, ltv_threshold)
+    btc_value = scenario['btc_value']
+    ltv = scenario['ltv']
+    coverage = scenario['coverage']
+    safety = scenario['safety']
 
     # Key Metrics Row
     col1, col2, col3, col4 = st.columns(4)
@@ -111,7 +163,7 @@ def main():
     with col1:
         st.metric(
             "BTC Holdings Value",
-            f"${calc.calculate_btc_value()/1_000_000:,.0f}M",
+            f"${btc_value/1_000_000:,.0f}M",
             help="Total value of BTC at current price"
         )
 
@@ -123,7 +175,6 @@ def main():
         )
 
     with col3:
-        ltv = calc.calculate_ltv_ratio()
         st.metric(
             "LTV Ratio",
             f"{ltv:.1%}",
@@ -133,7 +184,6 @@ def main():
         )
 
     with col4:
-        coverage = calc.calculate_collateral_coverage()
         st.metric(
             "Collateral Coverage",
             f"{coverage:.2f}x",
@@ -148,8 +198,6 @@ def main():
     with col1:
         st.subheader("🎯 Liquidation Price Analysis")
 
-        safety = calc.calculate_margin_of_safety(target_ltv=ltv_threshold)
-
         st.metric(
             "Liquidation Price",
             f"${safety['liquidation_price']:,.0f}",
@@ -193,10 +241,10 @@ def main():
     with col2:
         st.subheader("📉 Stress Test Scenarios")
 
-        stress_df = calc.stress_test_scenarios()
+        stress_df = stress_test_scenarios(*scenario_inputs)
 
         st.dataframe(
-            stress_df,
+            stress_df.style.format(STRESS_TEST_FORMATS),
             use_container_width=True,
             hide_index=True,
             height=400
@@ -208,13 +256,12 @@ def main():
     st.subheader("📈 Bitcoin Price vs LTV Ratio")
 
     # Generate data for chart
-    price_range = range(20000, 150000, 5000)
-    ltv_values = [calc.calculate_ltv_ratio(p) * 100 for p in price_range]
+    price_range, ltv_values = _price_ltv_curve(btc_holdings, debt_metrics['total_notional'])
 
     fig_line = go.Figure()
 
     fig_line.add_trace(go.Scatter(
-        x=list(price_range),
+        x=price_range,
         y=ltv_values,
         mode='lines',
         name='LTV Ratio',
@@ -258,11 +305,6 @@ def main():
     # Debt Details
     st.subheader("💳 Convertible Debt Details")
 
-    # Format the debt dataframe for display
-    display_df = debt_df.copy()
-    display_df['Issue Date'] = pd.to_datetime(display_df['Issue Date']).dt.strftime('%Y-%m-%d')
-    display_df['Maturity'] = pd.to_datetime(display_df['Maturity']).dt.strftime('%Y-%m-%d')
-
     st.dataframe(
         display_df,
         use_container_width=True,
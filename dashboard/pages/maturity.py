@@ -3,12 +3,14 @@ Maturity analysis page for Streamlit dashboard.
 """
 
 import streamlit as st
+import pandas as pd
 import sys
+from datetime import date
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.parsers.debt_parser import parse_debt_data
+from src.parsers.debt_parser import load_debt_cached
 from src.models.maturity_analysis import MaturityAnalyzer
 
 
@@ -21,15 +23,35 @@ st.set_page_config(
 
 @st.cache_data
 def load_data():
-    debt_df = parse_debt_data('data/raw/DEBT/data.html')
+    debt_df = load_debt_cached('data/raw/DEBT/data.html')
     return debt_df
 
 
+# Keyed on the frame's content hash and today's date: the analyzer fixes its
+# reference time at construction, so a new day needs a new analyzer
+@st.cache_resource(ttl="1d")
+def get_analyzer(debt_df_hash, as_of, _debt_df):
+    """Build the analyzer once per distinct debt frame and day."""
+    return MaturityAnalyzer(_debt_df)
+
+
+@st.cache_data(ttl="1d")
+def _build_timeline(debt_df_hash, as_of, _debt_df):
+    return get_analyzer(debt_df_hash, as_of, _debt_df).plot_maturity_timeline()
+
+
+@st.cache_data(ttl="1d")
+def _build_cumulative(debt_df_hash, as_of, _debt_df):
+    return get_analyzer(debt_df_hash, as_of, _debt_df).plot_cumulative_maturity()
+
+
 def main():
     st.title("📅 Debt Maturity & Refinancing Risk")
 
     debt_df = load_data()
-    analyzer = MaturityAnalyzer(debt_df)
+    debt_df_hash = hash(pd.util.hash_pandas_object(debt_df).values.tobytes())
+    as_of = date.today()
+    analyzer = get_analyzer(debt_df_hash, as_of, debt_df)
 
     st.markdown("---")
 
@@ -65,12 +87,12 @@ def main():
 
     # Maturity Timeline
     st.subheader("Debt Maturity Timeline")
-    fig_timeline = analyzer.plot_maturity_timeline()
+    fig_timeline = _build_timeline(debt_df_hash, as_of, debt_df)
     st.plotly_chart(fig_timeline, use_container_width=True)
 
     # Cumulative Maturity
     st.subheader("Cumulative Debt Maturity")
-    fig_cumulative = analyzer.plot_cumulative_maturity()
+    fig_cumulative = _build_cumulative(debt_df_hash, as_of, debt_df)
     st.plotly_chart(fig_cumulative, use_container_width=True)
 
     st.markdown("---")
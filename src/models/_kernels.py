@@ -0,0 +1,49 @@
+"""
+Numba-compiled kernels for batched risk calculations.
+
+Used by LiquidationCalculator.simulate() to evaluate LTV, collateral
+coverage and risk status across large arrays of simulated BTC prices.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+# fastmath without 'nnan'/'ninf': NaN and inf LTVs (e.g. a zero price) must
+# stay well-defined so they are labelled like the NumPy status mapping
+_FASTMATH_FLAGS = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+@njit(parallel=True, fastmath=_FASTMATH_FLAGS, cache=True)
+def stress_kernel(prices, btc_holdings, total_debt, thresholds):
+    """
+    Calculate LTV, coverage and status codes for a flat array of prices.
+
+    Args:
+        prices: 1-D float64 array of BTC prices
+        btc_holdings: Number of BTC held
+        total_debt: Total debt in dollars
+        thresholds: Sorted upper LTV bounds of each status band
+
+    Returns:
+        tuple of (ltvs, coverage, status_codes) where a status code is the
+        number of thresholds the LTV is not below (0 = Safe ... 3 = Danger;
+        NaN counts as Danger)
+    """
+    n = prices.shape[0]
+    ltvs = np.empty(n, dtype=np.float64)
+    coverage = np.empty(n, dtype=np.float64)
+    status_codes = np.empty(n, dtype=np.int8)
+
+    for i in prange(n):
+        ltv = total_debt / (btc_holdings * prices[i])
+        ltvs[i] = ltv
+        coverage[i] = 1.0 / ltv
+
+        code = 0
+        for t in thresholds:
+            if not (ltv < t):
+                code += 1
+        status_codes[i] = code
+
+    return ltvs, coverage, status_codes
@@ -11,6 +11,51 @@ Calculates:
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+if __name__ == "__main__":
+    # Running this file directly: put the repo root on the path for config/src imports
+    sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+try:
+    import numexpr as ne
+    _HAS_NUMEXPR = True
+except ImportError:  # optional speedup for large Monte Carlo sweeps
+    _HAS_NUMEXPR = False
+
+from config import RISK_THRESHOLDS, STRESS_LABELS, STRESS_MULTIPLIERS
+
+# Below this many prices numexpr's per-call overhead outweighs its gains
+NUMEXPR_MIN_SIZE = 10_000
+
+# Upper LTV bound of each status band; anything at or above the last is Danger
+_LTV_THRESHOLDS = np.array([
+    RISK_THRESHOLDS['safe_ltv'],
+    RISK_THRESHOLDS['caution_ltv'],
+    RISK_THRESHOLDS['warning_ltv'],
+])
+_STATUS_LABELS = np.array(['🟢 Safe', '🟡 Caution', '🟠 Warning', '🔴 Danger'])
+
+# Display formats for the numeric stress test columns
+STRESS_TEST_FORMATS = {
+    'BTC Price': '${:,.0f}',
+    'BTC Holdings Value (M)': '${:,.0f}',
+    'LTV Ratio': '{:.2%}',
+    'Collateral Coverage': '{:.2f}x',
+}
+
+
+def _status_vec(ltv):
+    """Map LTV ratios (scalar or array) to risk status labels."""
+    # The band index is the number of thresholds the LTV is not below; summing
+    # the comparisons keeps it branchless (same rule as the numba kernel).
+    # Counting ~(ltv < t) rather than ltv >= t sends NaN to Danger, not Safe
+    ltv = np.asarray(ltv)
+    idx = np.zeros(ltv.shape, dtype=np.int8)
+    for threshold in _LTV_THRESHOLDS:
+        idx += (~(ltv < threshold)).astype(np.int8)
+    return _STATUS_LABELS[idx]
 
 
 class LiquidationCalculator:
@@ -30,11 +75,57 @@ class LiquidationCalculator:
         self.btc_price = btc_price
         self.total_debt = total_debt * 1_000_000  # Convert to actual dollars
         self.annual_interest = annual_interest * 1_000_000
+        # LTV = Debt / (BTC_holdings * BTC_price), so the price-independent
+        # part of every ratio is computed once here
+        self._debt_over_holdings = self.total_debt / btc_holdings
+
+    def btc_value(self, prices):
+        """
+        Calculate total BTC holdings value at one or many prices.
+
+        Args:
+            prices: BTC price or array of BTC prices
+
+        Returns:
+            Holdings value (ndarray for array input)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        return self.btc_holdings * prices
+
+    def ltv_ratio(self, prices):
+        """
+        Calculate Loan-to-Value ratio at one or many prices.
+
+        Args:
+            prices: BTC price or array of BTC prices
+
+        Returns:
+            LTV ratio (ndarray for array input)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        if _HAS_NUMEXPR and prices.size > NUMEXPR_MIN_SIZE:
+            return ne.evaluate(
+                'k / prices',
+                local_dict={'k': self._debt_over_holdings, 'prices': prices}
+            )
+        return self._debt_over_holdings / prices
+
+    def collateral_coverage(self, prices):
+        """
+        Calculate collateral coverage ratio at one or many prices.
+
+        Args:
+            prices: BTC price or array of BTC prices
+
+        Returns:
+            Coverage ratio (ndarray for array input)
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        return prices / self._debt_over_holdings
 
     def calculate_btc_value(self, btc_price=None):
         """Calculate total BTC holdings value at given price."""
-        price = btc_price or self.btc_price
-        return self.btc_holdings * price
+        return self.btc_value(btc_price or self.btc_price)
 
     def calculate_ltv_ratio(self, btc_price=None):
         """
@@ -44,8 +135,7 @@ class LiquidationCalculator:
 
         Lower is better. High LTV means dangerous leverage.
         """
-        btc_value = self.calculate_btc_value(btc_price)
-        return self.total_debt / btc_value
+        return self.ltv_ratio(btc_price or self.btc_price)
 
     def calculate_collateral_coverage(self, btc_price=None):
         """
@@ -56,7 +146,7 @@ class LiquidationCalculator:
         >1.0 means overcollateralized
         <1.0 means undercollateralized (danger zone)
         """
-        return 1 / self.calculate_ltv_ratio(btc_price)
+        return self.collateral_coverage(btc_price or self.btc_price)
 
     def calculate_liquidation_price(self, target_ltv=0.85):
         """
@@ -74,8 +164,7 @@ class LiquidationCalculator:
         # LTV = Debt / (BTC_holdings * BTC_price)
         # Solving for BTC_price:
         # BTC_price = Debt / (BTC_holdings * LTV)
-        liquidation_price = self.total_debt / (self.btc_holdings * target_ltv)
-        return liquidation_price
+        return self._debt_over_holdings / target_ltv
 
     def calculate_margin_of_safety(self, target_ltv=0.85):
         """
@@ -115,46 +204,52 @@ class LiquidationCalculator:
         Run stress tests across various BTC price scenarios.
 
         Returns:
-            DataFrame with scenarios and metrics
-        """
-        current_price = self.btc_price
-        scenarios = [
-            ('Current', current_price),
-            ('-20%', current_price * 0.8),
-            ('-30%', current_price * 0.7),
-            ('-40%', current_price * 0.6),
-            ('-50%', current_price * 0.5),
-            ('-60%', current_price * 0.4),
-            ('-70%', current_price * 0.3),
-        ]
-
-        results = []
-        for name, price in scenarios:
-            ltv = self.calculate_ltv_ratio(price)
-            collateral_cov = self.calculate_collateral_coverage(price)
-            btc_value = self.calculate_btc_value(price)
-
-            results.append({
-                'Scenario': name,
-                'BTC Price': f'${price:,.0f}',
-                'BTC Holdings Value (M)': f'${btc_value/1_000_000:,.0f}',
-                'LTV Ratio': f'{ltv:.2%}',
-                'Collateral Coverage': f'{collateral_cov:.2f}x',
-                'Status': self._get_status(ltv)
-            })
-
-        return pd.DataFrame(results)
+            DataFrame with scenarios and numeric metrics
+            (see STRESS_TEST_FORMATS for display formatting)
+        """
+        prices = self.btc_price * STRESS_MULTIPLIERS
+
+        btc_values = self.btc_value(prices)
+        ltvs = self.ltv_ratio(prices)
+        collateral_cov = self.collateral_coverage(prices)
+
+        return pd.DataFrame({
+            'Scenario': STRESS_LABELS,
+            'BTC Price': prices,
+            'BTC Holdings Value (M)': btc_values / 1_000_000,
+            'LTV Ratio': ltvs,
+            'Collateral Coverage': collateral_cov,
+            'Status': _status_vec(ltvs)
+        })
+
+    def simulate(self, price_paths):
+        """
+        Evaluate risk metrics across simulated BTC price paths.
+
+        Args:
+            price_paths: Array of BTC prices of any shape
+                (e.g. runs x periods for Monte Carlo paths)
+
+        Returns:
+            dict with 'ltv', 'coverage' and 'status' arrays shaped like price_paths
+        """
+        # Imported lazily so numba's startup cost is only paid when simulating
+        from src.models._kernels import stress_kernel
+
+        price_paths = np.asarray(price_paths, dtype=np.float64)
+        ltvs, coverage, status_codes = stress_kernel(
+            price_paths.ravel(), float(self.btc_holdings), float(self.total_debt), _LTV_THRESHOLDS
+        )
+
+        return {
+            'ltv': ltvs.reshape(price_paths.shape),
+            'coverage': coverage.reshape(price_paths.shape),
+            'status': _STATUS_LABELS[status_codes].reshape(price_paths.shape)
+        }
 
     def _get_status(self, ltv):
         """Determine risk status based on LTV."""
-        if ltv < 0.50:
-            return '🟢 Safe'
-        elif ltv < 0.65:
-            return '🟡 Caution'
-        elif ltv < 0.85:
-            return '🟠 Warning'
-        else:
-            return '🔴 Danger'
+        return _status_vec(np.asarray(ltv)).item()
 
 
 if __name__ == "__main__":
@@ -181,4 +276,5 @@ if __name__ == "__main__":
     print(f"Buffer: ${safety['price_drop_dollars']:,.0f} ({safety['price_drop_percent']:.1f}%)")
 
     print("\n=== Stress Test Scenarios ===")
-    print(calc.stress_test_scenarios().to_string(index=False))
+    formatters = {col: fmt.format for col, fmt in STRESS_TEST_FORMATS.items()}
+    print(calc.stress_test_scenarios().to_string(index=False, formatters=formatters))
@@ -7,11 +7,28 @@ under various BTC price scenarios.
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import timedelta
+from pandas.api.types import is_datetime64_any_dtype
 import plotly.graph_objects as go
 import plotly.express as px
 
 
+_NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def _years_until(dates, now_ns):
+    """
+    Whole days from now until each date, expressed in years.
+
+    Works on the raw int64 nanosecond buffer instead of going through
+    pandas Timedelta objects. Missing dates come back as NaN.
+    """
+    values = dates.to_numpy(dtype='datetime64[ns]')
+    days = (values.view('int64') - now_ns) // _NS_PER_DAY
+    years = np.where(np.isnat(values), np.nan, days / 365.25)
+    return np.round(years, 2)
+
+
 class MaturityAnalyzer:
     """Analyze debt maturity schedule and refinancing risk."""
 
@@ -22,9 +39,31 @@ class MaturityAnalyzer:
         Args:
             debt_df: DataFrame with debt information including maturity dates
         """
-        self.debt_df = debt_df.copy()
-        self.debt_df['Maturity'] = pd.to_datetime(self.debt_df['Maturity'])
-        self.debt_df = self.debt_df.sort_values('Maturity')
+        # parse_debt_data already returns datetime64 columns; only coerce other inputs.
+        # assign/sort_values return new frames, so the caller's frame is never mutated
+        if not is_datetime64_any_dtype(debt_df['Maturity']):
+            debt_df = debt_df.assign(Maturity=pd.to_datetime(debt_df['Maturity']))
+        self.debt_df = debt_df.sort_values('Maturity')
+
+        # Single reference time so the schedule and rollover windows agree
+        self._now = pd.Timestamp.now()
+        self._schedule = self._build_schedule()
+        self._maturity_year = self._schedule['Maturity'].dt.year.rename('Maturity Year')
+        self._total_notional = self._schedule['Notional ($M)'].sum()
+
+    def _build_schedule(self):
+        """Build the maturity schedule once so later calls can reuse it."""
+        schedule = self.debt_df[['Name', 'Maturity', 'Notional ($M)', 'Coupon', 'Put Date']]
+        put_date = schedule['Put Date']
+        if not is_datetime64_any_dtype(put_date):
+            put_date = pd.to_datetime(put_date)
+
+        now_ns = np.int64(self._now.value)
+        return schedule.assign(**{
+            'Put Date': put_date,
+            'Years to Maturity': _years_until(schedule['Maturity'], now_ns),
+            'Years to Put': _years_until(put_date, now_ns),
+        })
 
     def get_maturity_schedule(self):
         """
@@ -33,18 +72,8 @@ class MaturityAnalyzer:
         Returns:
             DataFrame with maturity timeline
         """
-        schedule = self.debt_df[['Name', 'Maturity', 'Notional ($M)', 'Coupon', 'Put Date']].copy()
-        schedule['Put Date'] = pd.to_datetime(schedule['Put Date'])
-
-        now = pd.Timestamp.now()
-        schedule['Years to Maturity'] = (
-            (schedule['Maturity'] - now).dt.days / 365.25
-        ).round(2)
-        schedule['Years to Put'] = (
-            (schedule['Put Date'] - now).dt.days / 365.25
-        ).round(2)
-
-        return schedule
+        # Copy so callers can't mutate the cached schedule other methods rely on
+        return self._schedule.copy()
 
     def calculate_maturity_wall(self):
         """
@@ -53,13 +82,12 @@ class MaturityAnalyzer:
         Returns:
             DataFrame showing debt maturing each year
         """
-        schedule = self.get_maturity_schedule()
-        schedule['Maturity Year'] = schedule['Maturity'].dt.year
-
-        wall = schedule.groupby('Maturity Year').agg({
-            'Notional ($M)': 'sum',
-            'Name': 'count'
-        }).rename(columns={'Name': 'Number of Bonds'})
+        wall = self._schedule.groupby(self._maturity_year, sort=True).agg(
+            **{
+                'Notional ($M)': ('Notional ($M)', 'sum'),
+                'Number of Bonds': ('Name', 'count'),
+            }
+        )
 
         wall['Percentage of Total'] = (
             wall['Notional ($M)'] / wall['Notional ($M)'].sum() * 100
@@ -77,46 +105,28 @@ class MaturityAnalyzer:
         Returns:
             DataFrame with refinancing risk assessment
         """
-        schedule = self.get_maturity_schedule()
+        schedule = self._schedule
 
-        # Merge with original debt_df to get conversion prices
-        schedule = schedule.merge(
-            self.debt_df[['Name', 'Conversion Price']],
-            on='Name',
-            how='left'
-        )
+        # Schedule rows are built from debt_df in the same order, so the
+        # conversion prices line up without a merge
+        conversion_price = self.debt_df['Conversion Price'].to_numpy(dtype=np.float64)
+        notional = schedule['Notional ($M)'].to_numpy()
 
         # Calculate if bonds will be in the money (ITM) to convert
         # Bond converts if current stock price > conversion price
         # For simplicity, assume MSTR stock moves with BTC
-        schedule['In the Money'] = (
-            schedule['Conversion Price'].notna() &
-            (btc_price_at_maturity > 50000)  # Simplified assumption
-        )
+        in_the_money = ~np.isnan(conversion_price) & (btc_price_at_maturity > 50000)  # Simplified assumption
 
         # If ITM, likely converts to equity (good - no cash needed)
         # If OTM, needs cash refinancing (risk)
-        schedule['Refinancing Needed'] = ~schedule['In the Money']
-        schedule['Cash Requirement ($M)'] = np.where(
-            schedule['Refinancing Needed'],
-            schedule['Notional ($M)'],
-            0
-        )
-
-        schedule['Status'] = np.where(
-            schedule['In the Money'],
-            '✅ Likely Converts',
-            '⚠️ Needs Refinancing'
-        )
-
-        return schedule[[
-            'Name',
-            'Maturity',
-            'Notional ($M)',
-            'Status',
-            'Cash Requirement ($M)',
-            'Years to Maturity'
-        ]]
+        return pd.DataFrame({
+            'Name': schedule['Name'].to_numpy(),
+            'Maturity': schedule['Maturity'].to_numpy(),
+            'Notional ($M)': notional,
+            'Status': np.where(in_the_money, '✅ Likely Converts', '⚠️ Needs Refinancing'),
+            'Cash Requirement ($M)': np.where(in_the_money, 0.0, notional),
+            'Years to Maturity': schedule['Years to Maturity'].to_numpy()
+        })
 
     def plot_maturity_timeline(self):
         """
@@ -201,19 +211,18 @@ class MaturityAnalyzer:
         Returns:
             dict with rollover metrics
         """
-        schedule = self.get_maturity_schedule()
-        cutoff_date = datetime.now() + timedelta(days=years_ahead * 365.25)
+        cutoff_date = np.datetime64(self._now + timedelta(days=years_ahead * 365.25))
 
-        maturing_soon = schedule[schedule['Maturity'] <= cutoff_date]
+        mask = self._schedule['Maturity'].values <= cutoff_date
+        notional = self._schedule['Notional ($M)'].values
+        # nansum: a missing ("—") notional should not blank out the total
+        total_maturing = np.nansum(notional[mask])
 
         return {
-            'total_maturing': maturing_soon['Notional ($M)'].sum(),
-            'number_of_bonds': len(maturing_soon),
+            'total_maturing': total_maturing,
+            'number_of_bonds': int(mask.sum()),
             'years_analyzed': years_ahead,
-            'percentage_of_total': (
-                maturing_soon['Notional ($M)'].sum() /
-                schedule['Notional ($M)'].sum() * 100
-            )
+            'percentage_of_total': total_maturing / self._total_notional * 100
         }
 
 
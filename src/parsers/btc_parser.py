@@ -3,24 +3,30 @@ Parser for MicroStrategy Bitcoin holdings data.
 Extracts current BTC holdings, market value, and volatility metrics.
 """
 
-from bs4 import BeautifulSoup
-import re
+from lxml import etree, html as lh
+
+
+_GRID_TITLES = etree.XPath("//div[contains(@class, 'numberGridTitle')]")
+_GRID_VALUE = etree.XPath("following-sibling::p[contains(@class, 'numberGridLargeValue')][1]")
+
+
+def _node_text(node):
+    """Concatenate a node's stripped text pieces (like BS4's get_text(strip=True))."""
+    return ''.join(text.strip() for text in node.itertext())
 
 
 def parse_currency(value_str):
     """Convert currency string to float."""
     if not value_str or value_str == '—':
         return None
-    cleaned = re.sub(r'[$,]', '', value_str)
-    return float(cleaned)
+    return float(value_str.replace('$', '').replace(',', ''))
 
 
 def parse_percentage(value_str):
     """Convert percentage string to float."""
     if not value_str or value_str == '—':
         return None
-    cleaned = value_str.replace('%', '')
-    return float(cleaned)
+    return float(value_str.rstrip('%'))
 
 
 def parse_btc_holdings(html_file_path):
@@ -33,28 +39,28 @@ def parse_btc_holdings(html_file_path):
     Returns:
         dict with BTC holdings information
     """
-    with open(html_file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    soup = BeautifulSoup(html_content, 'lxml')
+    parser = lh.HTMLParser(encoding='utf-8')
+    doc = lh.parse(html_file_path, parser=parser).getroot()
 
     # Find all metric elements
     metrics = {}
 
     # Look for the grid items containing the data
-    grid_items = soup.find_all('div', class_=re.compile('numberGridTitle'))
+    grid_items = _GRID_TITLES(doc)
 
     for item in grid_items:
-        title_elem = item.find('span')
-        if not title_elem:
+        title_elem = item.find('.//span')
+        if title_elem is None:
             continue
 
-        title = title_elem.get('aria-label', title_elem.get_text(strip=True))
+        title = title_elem.get('aria-label')
+        if title is None:
+            title = _node_text(title_elem)
 
         # Find the associated value
-        value_elem = item.find_next_sibling('p', class_=re.compile('numberGridLargeValue'))
-        if value_elem:
-            value = value_elem.get_text(strip=True)
+        value_elems = _GRID_VALUE(item)
+        if value_elems:
+            value = _node_text(value_elems[0])
 
             # Parse based on title
             if 'BTC' in title and 'Price' in title:
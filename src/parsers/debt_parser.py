@@ -4,9 +4,21 @@ Extracts bond information including maturity dates, coupons, conversion prices,
 """
 
 from bs4 import BeautifulSoup
+import numpy as np
 import pandas as pd
 from datetime import datetime
-import re
+from pathlib import Path
+import os
+import tempfile
+
+
+# Bump whenever parse_debt_data's output changes so stale Parquet caches are ignored
+PARSER_VERSION = 2
+
+DATE_COLUMNS = ['Issue Date', 'Maturity', 'Put Date', 'Earliest Call Date']
+CURRENCY_COLUMNS = [
+    'Price', 'Notional ($M)', 'Market Val ($M)', 'BTC Par', 'Ref Price', 'Conversion Price'
+]
 
 
 def parse_currency(value_str):
@@ -14,8 +26,7 @@ def parse_currency(value_str):
     if not value_str or value_str == '—':
         return None
     # Remove $, commas, and convert to float
-    cleaned = re.sub(r'[$,]', '', value_str)
-    return float(cleaned)
+    return float(value_str.replace('$', '').replace(',', ''))
 
 
 def parse_percentage(value_str):
@@ -23,8 +34,7 @@ def parse_percentage(value_str):
     if not value_str or value_str == '—':
         return None
     # Remove % and convert to float
-    cleaned = value_str.replace('%', '')
-    return float(cleaned)
+    return float(value_str.rstrip('%'))
 
 
 def parse_date(date_str):
@@ -47,10 +57,9 @@ def parse_debt_data(html_file_path):
     Returns:
         pandas.DataFrame with parsed debt information
     """
-    with open(html_file_path, 'r', encoding='utf-8') as f:
-        html_content = f.read()
-
-    soup = BeautifulSoup(html_content, 'lxml')
+    # Hand lxml the raw bytes rather than decoding to str first
+    with open(html_file_path, 'rb') as f:
+        soup = BeautifulSoup(f, 'lxml', from_encoding='utf-8')
 
     # Find the table with debt data
     table = soup.find('table')
@@ -65,43 +74,86 @@ def parse_debt_data(html_file_path):
         label = th.get('aria-label', th.get_text(strip=True))
         headers.append(label)
 
-    # Extract data rows
+    # Extract data rows column by column (skipping the totals row), so the
+    # DataFrame can be built without transposing row lists
     tbody = table.find('tbody')
-    rows_data = []
-
-    for tr in tbody.find_all('tr', recursive=False):
-        # Skip totals row
-        classes = tr.get('class', [])
-        if any('totalsRow' in cls for cls in classes):
-            continue
+    columns = [[] for _ in headers]
 
+    for tr in tbody.select(':scope > tr:not([class*="totalsRow"])'):
         cells = tr.find_all('td')
         if not cells:
             continue
 
-        row_data = []
-        for cell in cells:
-            text = cell.get_text(strip=True)
-            row_data.append(text)
+        for column, cell in zip(columns, cells):
+            # Most cells hold a single text node; only walk descendants when not
+            text = cell.string
+            column.append(text.strip() if text is not None else cell.get_text(strip=True))
 
-        rows_data.append(row_data)
+        # Pad short rows so every column stays aligned with the row index
+        for column in columns[len(cells):]:
+            column.append(None)
 
     # Create DataFrame
-    df = pd.DataFrame(rows_data, columns=headers)
-
-    # Clean and convert data types
-    df['Issue Date'] = df['Issue Date'].apply(parse_date)
-    df['Maturity'] = df['Maturity'].apply(parse_date)
-    df['Put Date'] = df['Put Date'].apply(parse_date)
-    df['Earliest Call Date'] = df['Earliest Call Date'].apply(parse_date)
-
-    df['Price'] = df['Price'].apply(parse_currency)
-    df['Coupon'] = df['Coupon'].apply(parse_percentage)
-    df['Notional ($M)'] = df['Notional ($M)'].apply(parse_currency)
-    df['Market Val ($M)'] = df['Market Val ($M)'].apply(parse_currency)
-    df['BTC Par'] = df['BTC Par'].apply(parse_currency)
-    df['Ref Price'] = df['Ref Price'].apply(parse_currency)
-    df['Conversion Price'] = df['Conversion Price'].apply(parse_currency)
+    df = pd.DataFrame(dict(zip(headers, columns)))
+
+    # Treat placeholder cells as missing up front so the converters see real NAs
+    df = df.replace({'—': None, '': None})
+
+    # Clean and convert data types, one vectorized pass per column
+    df[DATE_COLUMNS] = df[DATE_COLUMNS].apply(
+        pd.to_datetime, format='%m/%d/%Y', errors='coerce'
+    )
+
+    for col in CURRENCY_COLUMNS:
+        df[col] = pd.to_numeric(
+            df[col].str.replace('[$,]', '', regex=True),
+            errors='coerce'
+        ).astype(np.float64)
+
+    df['Coupon'] = pd.to_numeric(
+        df['Coupon'].str.rstrip('%'),
+        errors='coerce'
+    ).astype(np.float64)
+
+    return df
+
+
+def load_debt_cached(html_file_path):
+    """
+    Load debt data, reusing a Parquet copy of the parsed frame when possible.
+
+    The cache sits next to the HTML file, is tagged with PARSER_VERSION, and
+    is rebuilt whenever the HTML is newer than it. Failing to write the cache
+    (e.g. a read-only data directory) is not an error.
+
+    Args:
+        html_file_path: Path to HTML file containing debt data
+
+    Returns:
+        pandas.DataFrame with parsed debt information
+    """
+    html_path = Path(html_file_path)
+    cache_path = html_path.with_suffix(f'.v{PARSER_VERSION}.parquet')
+
+    if cache_path.exists() and cache_path.stat().st_mtime >= html_path.stat().st_mtime:
+        try:
+            return pd.read_parquet(cache_path)
+        except (OSError, ValueError):
+            pass  # unreadable cache; reparse and overwrite it below
+
+    df = parse_debt_data(html_path)
+
+    # Write to a temp file and swap it in, so a concurrent reader never sees
+    # a partially written cache
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.parquet.tmp')
+        os.close(fd)
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ImportError):
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
     return df
 
@@ -116,11 +168,20 @@ def calculate_debt_metrics(df):
     Returns:
         dict with calculated metrics
     """
+    # Notional weights; missing values count as zero, as Series.sum() would skip them
+    weights = np.nan_to_num(df['Notional ($M)'].to_numpy(dtype=np.float64))
+    total_notional = weights.sum()
+    coupon_dollars = np.dot(np.nan_to_num(df['Coupon'].to_numpy(dtype=np.float64)), weights)
+    conversion_dollars = np.dot(
+        np.nan_to_num(df['Conversion Price'].to_numpy(dtype=np.float64)), weights
+    )
+
     metrics = {
-        'total_notional': df['Notional ($M)'].sum(),
+        'total_notional': total_notional,
         'total_market_value': df['Market Val ($M)'].sum(),
-        'weighted_avg_coupon': (df['Coupon'] * df['Notional ($M)']).sum() / df['Notional ($M)'].sum(),
-        'weighted_avg_conversion_price': (df['Conversion Price'] * df['Notional ($M)']).sum() / df['Notional ($M)'].sum(),
+        'weighted_avg_coupon': coupon_dollars / total_notional,
+        'annual_interest': coupon_dollars / 100,
+        'weighted_avg_conversion_price': conversion_dollars / total_notional,
         'num_bonds': len(df),
         'nearest_maturity': df['Maturity'].min(),
         'furthest_maturity': df['Maturity'].max(),
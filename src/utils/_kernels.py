@@ -0,0 +1,34 @@
+"""
+Numba-compiled kernels for the utility helpers.
+
+Imported lazily by calculate_max_drawdown() so importing helpers does not
+pay numba's import and compile cost; without numba it falls back to NumPy.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, error_model='numpy')
+def max_drawdown_kernel(values):
+    """
+    Single pass over values tracking the running peak and worst drawdown.
+
+    Args:
+        values: 1-D float64 array of portfolio values
+
+    Returns:
+        Worst drawdown as a fraction, or NaN if any drawdown is NaN
+        (matching the NumPy cummax implementation)
+    """
+    peak = values[0]
+    worst = 0.0
+    for value in values:
+        if value > peak:
+            peak = value
+        drawdown = (value - peak) / peak
+        if np.isnan(drawdown):
+            return np.nan
+        if drawdown < worst:
+            worst = drawdown
+    return worst
@@ -43,11 +43,14 @@ def calculate_sharpe_ratio(returns, risk_free_rate=0.04):
     if len(returns) == 0:
         return 0
 
-    excess_returns = returns - (risk_free_rate / 252)  # Daily risk-free rate
-    if excess_returns.std() == 0:
+    # Subtracting a constant shifts the mean but not the std, so work on
+    # returns directly instead of allocating an excess-returns array
+    std = returns.std()
+    if std == 0:
         return 0
 
-    sharpe = np.sqrt(252) * (excess_returns.mean() / excess_returns.std())
+    excess_mean = returns.mean() - (risk_free_rate / 252)  # Daily risk-free rate
+    sharpe = np.sqrt(252) * (excess_mean / std)
     return sharpe
 
 
@@ -64,11 +67,31 @@ def calculate_max_drawdown(values):
     if len(values) == 0:
         return 0
 
+    # The compiled kernel only handles flat float64 arrays; anything else
+    # (lists, 2-D input, other dtypes), or an install without numba, keeps
+    # the NumPy path
+    if (isinstance(values, np.ndarray) and values.ndim == 1
+            and values.dtype == np.float64 and values.flags.c_contiguous):
+        try:
+            from src.utils._kernels import max_drawdown_kernel
+        except ImportError:
+            pass
+        else:
+            return max_drawdown_kernel(values) * 100
+
     cummax = np.maximum.accumulate(values)
     drawdown = (values - cummax) / cummax
     return drawdown.min() * 100
 
 
+# (threshold, suffix) pairs for format_currency, largest first
+_CURRENCY_SCALES = (
+    (1_000_000_000, 'B'),
+    (1_000_000, 'M'),
+    (1_000, 'K'),
+)
+
+
 def format_currency(amount, decimals=0):
     """
     Format number as currency string.
@@ -80,22 +103,21 @@ def format_currency(amount, decimals=0):
     Returns:
         Formatted string
     """
-    if amount >= 1_000_000_000:
-        return f"${amount/1_000_000_000:.{decimals}f}B"
-    elif amount >= 1_000_000:
-        return f"${amount/1_000_000:.{decimals}f}M"
-    elif amount >= 1_000:
-        return f"${amount/1_000:.{decimals}f}K"
-    else:
-        return f"${amount:.{decimals}f}"
+    magnitude = abs(amount)
+    for threshold, suffix in _CURRENCY_SCALES:
+        if magnitude >= threshold:
+            return f"${amount/threshold:.{decimals}f}{suffix}"
+    return f"${amount:.{decimals}f}"
 
 
-def calculate_days_until(target_date):
+def calculate_days_until(target_date, now=None):
     """
     Calculate days from now until target date.
 
     Args:
         target_date: Target datetime
+        now: Reference time (defaults to the current time); pass it in when
+            calling in a loop to avoid reading the clock on every call
 
     Returns:
         Number of days
@@ -104,12 +126,32 @@ def calculate_days_until(target_date):
         return None
 
     if isinstance(target_date, str):
-        target_date = pd.to_datetime(target_date)
+        target_date = pd.Timestamp(target_date)
 
-    delta = target_date - datetime.now()
+    if now is None:
+        now = datetime.now()
+
+    delta = target_date - now
     return delta.days
 
 
+def days_until_series(dates, now=None):
+    """
+    Calculate days from now until each date in a Series.
+
+    Args:
+        dates: Series of datetimes or date strings
+        now: Reference time (defaults to the current time)
+
+    Returns:
+        Series of day counts (NaN where the date is missing)
+    """
+    if now is None:
+        now = pd.Timestamp.now()
+
+    return (pd.to_datetime(dates) - now).dt.days
+
+
 def calculate_yield_to_maturity(price, face_value, coupon, years_to_maturity):
     """
     Approximate yield to maturity for a bond.
@@ -132,6 +174,26 @@ def calculate_yield_to_maturity(price, face_value, coupon, years_to_maturity):
     return ytm * 100
 
 
+# Below this |ytm| the closed form's numerator and (1 - v)**2 both approach
+# zero and the subtraction cancels, so the direct sum is used instead
+_CLOSED_FORM_MIN_YTM = 1e-3
+
+
+def _pv_coupons(annual_coupon, ytm, n):
+    """
+    Sum of time-weighted coupon present values for years 1..n.
+
+    Closed form of the arithmetico-geometric series sum(t * v**t), v = 1/(1+ytm),
+    falling back to the O(n) sum when ytm is near zero.
+    """
+    if abs(ytm) < _CLOSED_FORM_MIN_YTM:
+        return sum(annual_coupon * t / (1 + ytm) ** t for t in range(1, n + 1))
+
+    v = 1.0 / (1.0 + ytm)
+    vn = v ** n
+    return annual_coupon * v * (1 - (n + 1) * vn + n * v * vn) / (1 - v) ** 2
+
+
 def calculate_bond_duration(price, face_value, coupon, years_to_maturity):
     """
     Calculate Macaulay duration of a bond.
@@ -155,10 +217,7 @@ def calculate_bond_duration(price, face_value, coupon, years_to_maturity):
         return years_to_maturity
 
     # Simplified duration calculation
-    pv_coupons = sum([
-        (annual_coupon * t) / ((1 + ytm) ** t)
-        for t in range(1, int(years_to_maturity) + 1)
-    ])
+    pv_coupons = _pv_coupons(annual_coupon, ytm, int(years_to_maturity))
 
     pv_face = (face_value * years_to_maturity) / ((1 + ytm) ** years_to_maturity)
 
@@ -23,16 +23,9 @@ def create_ltv_heatmap(calc, btc_price_range, debt_range):
     btc_prices = np.linspace(btc_price_range[0], btc_price_range[1], 20)
     debt_multipliers = np.linspace(debt_range[0], debt_range[1], 15)
 
-    ltv_matrix = np.zeros((len(debt_multipliers), len(btc_prices)))
-
-    original_debt = calc.total_debt
-
-    for i, debt_mult in enumerate(debt_multipliers):
-        for j, btc_price in enumerate(btc_prices):
-            calc.total_debt = original_debt * debt_mult
-            ltv_matrix[i, j] = calc.calculate_ltv_ratio(btc_price) * 100
-
-    calc.total_debt = original_debt  # Reset
+    # LTV scales linearly with debt, so the grid is an outer product of the
+    # debt multipliers and the LTV curve at current debt
+    ltv_matrix = debt_multipliers[:, None] * calc.ltv_ratio(btc_prices)[None, :] * 100
 
     fig = go.Figure(data=go.Heatmap(
         z=ltv_matrix,
@@ -66,16 +59,19 @@ def create_waterfall_chart(debt_df):
     Returns:
         Plotly figure
     """
-    bonds = debt_df['Name'].tolist()
-    amounts = debt_df['Notional ($M)'].tolist()
+    amounts = debt_df['Notional ($M)'].to_numpy(dtype=float)
+    total = float(amounts.sum())
+
+    x = debt_df['Name'].tolist() + ["Total"]
+    y = amounts.tolist() + [total]
 
     fig = go.Figure(go.Waterfall(
         name="Debt",
         orientation="v",
-        measure=["relative"] * len(bonds) + ["total"],
-        x=bonds + ["Total"],
-        y=amounts + [sum(amounts)],
-        text=[f"${amt:,.0f}M" for amt in amounts] + [f"${sum(amounts):,.0f}M"],
+        measure=["relative"] * amounts.size + ["total"],
+        x=x,
+        y=y,
+        text=[f"${amt:,.0f}M" for amt in y],
         textposition="outside",
         connector={"line": {"color": "rgb(63, 63, 63)"}},
     ))
@@ -138,15 +134,20 @@ def create_scenario_comparison(scenarios_data):
     Returns:
         Plotly figure
     """
+    status = scenarios_data['Status'].astype(str)
+    colors = np.select(
+        [status.str.contains('Safe'), status.str.contains('Caution'), status.str.contains('Warning')],
+        ['green', 'yellow', 'orange'],
+        default='red'
+    )
+
     fig = go.Figure()
 
     fig.add_trace(go.Bar(
         x=scenarios_data['Scenario'],
-        y=scenarios_data['LTV Ratio'].str.rstrip('%').astype(float),
-        marker_color=['green' if 'Safe' in status else 'yellow' if 'Caution' in status
-                      else 'orange' if 'Warning' in status else 'red'
-                      for status in scenarios_data['Status']],
-        text=scenarios_data['LTV Ratio'],
+        y=scenarios_data['LTV Ratio'] * 100,
+        marker_color=colors,
+        text=scenarios_data['LTV Ratio'].map('{:.2%}'.format),
         textposition='auto',
     ))
 